@@ -0,0 +1,62 @@
+# Compare rendering a season's rows from scratch against reusing them from row_cache.json.
+# Run from the repo root: python -m benchmarks.row_cache
+#
+# On a 15-row season the warm cache saves roughly 15-200 us of a ~0.5 ms render; most of the
+# render is writing index.html. That is a small win, and tiny next to the network fetches.
+import os
+import tempfile
+import timeit
+
+from nebraska_schedule.rankings import build_ranking_index
+from nebraska_schedule.render import generate_html
+from nebraska_schedule.row_cache import load_row_cache, save_row_cache
+
+ROWS = 15  # About one regular season plus a bowl game
+NUMBER = 200
+REPEAT = 7
+
+def make_season():
+    events = []
+    for i in range(ROWS):
+        events.append({
+            'opponent_name': f"Team {i}",
+            'opponent': {'official_logo': {'url': f"team{i}.png"}},
+            'location': "Lincoln, Neb.",
+            'datetime': f"2024-09-{i + 1:02d}T17:30:00.000Z",
+            'schedule_event_links': [],
+            'schedule_event_result': {'result': 'win', 'winning_score': "28", 'losing_score': "10"},
+        })
+    # Leave the last game unplayed so there is an upcoming game
+    events[-1]['datetime'] = "2099-11-29T17:30:00.000Z"
+    events[-1]['schedule_event_result'] = {'result': None}
+    ranking_index = build_ranking_index({'AP': {f"Team {i}": f"#{i + 1}" for i in range(ROWS)}})
+    return events, ranking_index
+
+def main():
+    events, ranking_index = make_season()
+    directory = tempfile.mkdtemp()
+    output_path = os.path.join(directory, "index.html")
+    cache_path = os.path.join(directory, "row_cache.json")
+
+    def uncached():
+        generate_html(events, ranking_index, output_path=output_path)
+
+    # What render_data does: load the cache, reuse rows, save it back only if rows changed
+    def cached():
+        rows = load_row_cache(cache_path, 2024)
+        cached_keys = set(rows)
+        generate_html(events, ranking_index, output_path=output_path, row_cache=rows)
+        if set(rows) != cached_keys:
+            save_row_cache(cache_path, 2024, rows)
+
+    cached()  # Warm the cache
+    # Best of several repeats, since file writes make single timings noisy
+    uncached_us = min(timeit.repeat(uncached, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e6
+    cached_us = min(timeit.repeat(cached, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e6
+    print(f"{ROWS} rows, best of {REPEAT} x {NUMBER} renders")
+    print(f"No row cache:        {uncached_us:8.0f} us")
+    print(f"Warm row cache:      {cached_us:8.0f} us (incl. row_cache.json load)")
+    print(f"Saved per render:    {uncached_us - cached_us:8.0f} us")
+
+if __name__ == "__main__":
+    main()
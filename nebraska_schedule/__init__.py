@@ -0,0 +1,17 @@
+from .formatting import (
+    filter_2024_schedule,
+    filter_season_schedule,
+    format_date,
+    format_ranking,
+    format_result,
+    format_time_to_cst,
+    get_upcoming_game,
+)
+from .loadtest import run_load_test
+from .pipeline import fetch_data, load_data, render_data, run_pipeline, save_data
+from .publish import publish, strong_etag
+from .rankings import build_ranking_index, fetch_polls, fetch_ranking_index, lookup_team, normalize_team
+from .render import generate_html, render_row
+from .row_cache import event_key, load_row_cache, save_row_cache
+from .server import StaticServer, serve
+from .sources import fetch_schedule, get_nebraska_odds, scrape_ncaa_rankings
@@ -0,0 +1,7 @@
+import sys
+
+from .cli import main
+
+# Main code execution
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+import argparse
+import os
+import sys
+import threading
+
+from .loadtest import format_report, run_load_test
+from .pipeline import CACHE_FILENAME, DEFAULT_SEASON, fetch_data, load_data, render_data, run_pipeline, save_data
+from .profiling import profile_call
+from .rankings import DEFAULT_POLL, POLLS, RANKINGS_CACHE_FILENAME
+from .server import StaticServer, serve
+
+# Stage: fetch from the network and save the data for later renders
+def cmd_fetch(args):
+    data = fetch_data(args.season, os.path.join(args.output_dir, RANKINGS_CACHE_FILENAME))
+    save_data(data, args.cache)
+    print(f"Saved {len(data['schedule'])} games to {args.cache}")
+
+# Stage: render saved data to HTML without touching the network
+def cmd_render(args):
+    data = load_data(args.cache)
+    render_data(data, args.output, preferred_poll=args.poll)
+    print(f"Wrote {args.output}")
+
+# Stage: fetch (or replay) and render in one go
+def cmd_run(args):
+    run_pipeline(output_path=args.output, season=args.season, cache_path=args.cache, offline=args.offline,
+                 preferred_poll=args.poll)
+    print(f"Wrote {args.output}")
+
+# Serve the generated directory with ETags, precompressed files and ranges
+def cmd_serve(args):
+    serve(args.output_dir, bind=args.bind, port=args.port, quiet=args.quiet)
+
+# Measure how the static server holds up with many kiosks polling at once
+def cmd_loadtest(args):
+    url = args.url
+    httpd = None
+    if url is None:
+        # No URL given: load-test an in-process server for the output directory
+        httpd = StaticServer(args.output_dir, ("127.0.0.1", 0))
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{httpd.server_address[1]}/"
+
+    try:
+        result = run_load_test(url, clients=args.clients, duration=args.duration,
+                               conditional=not args.no_conditional, encoding=args.accept_encoding)
+    finally:
+        if httpd is not None:
+            httpd.shutdown()
+            httpd.server_close()
+    print(format_report(result))
+
+COMMANDS = {"fetch": cmd_fetch, "render": cmd_render, "run": cmd_run, "serve": cmd_serve, "loadtest": cmd_loadtest}
+
+def build_parser():
+    # Options shared by every subcommand, so they can follow it
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--output-dir", default=".", help="directory for index.html and the data cache (default: %(default)s)")
+    common.add_argument("--profile", metavar="REPORT", help="profile the stage with cProfile/tracemalloc and write a report to REPORT")
+
+    # Options for the stages that build the page, each added only where it applies
+    season = argparse.ArgumentParser(add_help=False)
+    season.add_argument("--season", type=int, default=DEFAULT_SEASON, help="season year to fetch (default: %(default)s)")
+    cache = argparse.ArgumentParser(add_help=False)
+    cache.add_argument("--cache", help=f"path of the data cache (default: OUTPUT_DIR/{CACHE_FILENAME})")
+    poll = argparse.ArgumentParser(add_help=False)
+    poll.add_argument("--poll", choices=list(POLLS), default=DEFAULT_POLL,
+                      help="poll to show rankings from; other polls are shown as labelled fallbacks (default: %(default)s)")
+
+    parser = argparse.ArgumentParser(prog="nebraska_schedule", description="Build the Nebraska football schedule page.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("fetch", parents=[common, season, cache], help="fetch schedule, rankings and odds into the cache")
+    subparsers.add_parser("render", parents=[common, cache, poll], help="render index.html from the cache")
+    run_parser = subparsers.add_parser("run", parents=[common, season, cache, poll], help="fetch and render (the default)")
+    run_parser.add_argument("--offline", "--replay", dest="offline", action="store_true",
+                            help="replay the cached data instead of fetching")
+
+    serve_parser = subparsers.add_parser("serve", parents=[common], help="serve the output directory over HTTP")
+    serve_parser.add_argument("--bind", default="127.0.0.1", help="address to listen on (default: %(default)s)")
+    serve_parser.add_argument("--port", type=int, default=8000, help="port to listen on (default: %(default)s)")
+    serve_parser.add_argument("--quiet", action="store_true", help="don't log each request")
+
+    loadtest_parser = subparsers.add_parser("loadtest", parents=[common], help="poll the page with many clients and report throughput")
+    loadtest_parser.add_argument("--url", help="page to poll (default: serve OUTPUT_DIR in-process)")
+    loadtest_parser.add_argument("--clients", type=int, default=50, help="concurrent polling clients (default: %(default)s)")
+    loadtest_parser.add_argument("--duration", type=float, default=10.0, help="seconds to run (default: %(default)s)")
+    loadtest_parser.add_argument("--accept-encoding", default="br, gzip", help="Accept-Encoding to send (default: %(default)s)")
+    loadtest_parser.add_argument("--no-conditional", action="store_true", help="don't send If-None-Match, always fetch the full page")
+    return parser
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Keep `python -m nebraska_schedule` doing a full run like it always has
+    if not argv or (argv[0] not in COMMANDS and argv[0] not in ("-h", "--help")):
+        argv = ["run"] + list(argv)
+
+    args = build_parser().parse_args(argv)
+    func = COMMANDS[args.command]
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    args.output = os.path.join(args.output_dir, "index.html")
+    if getattr(args, "cache", None) is None:
+        args.cache = os.path.join(args.output_dir, CACHE_FILENAME)
+
+    if args.profile:
+        profile_call(func, args.profile, args)
+        print(f"Profile report written to {args.profile}")
+    else:
+        func(args)
+    return 0
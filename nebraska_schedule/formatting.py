@@ -0,0 +1,89 @@
+from datetime import datetime
+import pytz
+
+from .rankings import DEFAULT_POLL, POLLS, lookup_team
+
+DEFAULT_SEASON = 2024
+
+# Function to filter for a season based on e.g. "name": "Football 2024"
+def filter_season_schedule(all_data, season):
+    filtered_data = [event for event in all_data if event['schedule']['name'] == f"Football {season}"]
+    return filtered_data
+
+# Function to filter for 2024 season based on "name": "Football 2024"
+def filter_2024_schedule(all_data):
+    return filter_season_schedule(all_data, 2024)
+
+# Helper function to format the date as "Aug 31 (Sat)"
+def format_date(date_str, opponent_name=None):
+    # Hardcoded dates for Illinois and Iowa games
+    if opponent_name == "Illinois":
+        return "Sep 20 (Fri)"
+    elif opponent_name == "Iowa":
+        return "Nov 29 (Fri)"
+
+    # Normal date formatting for other games
+    date_obj = datetime.strptime(date_str.split('T')[0], "%Y-%m-%d")
+    return date_obj.strftime("%b %d (%a)")
+
+# Helper function to convert UTC to CST and format the game time
+def format_time_to_cst(utc_time_str):
+    cst = pytz.timezone('America/Chicago')
+    utc_time = datetime.strptime(utc_time_str, "%Y-%m-%dT%H:%M:%S.%fZ")
+    cst_time = utc_time.replace(tzinfo=pytz.utc).astimezone(cst)
+    return cst_time.strftime("%I:%M %p CST")
+
+# Helper function to handle result and score display
+def format_result(event):
+    # Check if game time is marked as "TBA"
+    if 'tba' in event and event['tba'] == "time_tba":
+        return "TBA"
+
+    if 'schedule_event_result' in event and event['schedule_event_result']['result']:
+        result_data = event['schedule_event_result']
+        winning_score = result_data['winning_score']
+        losing_score = result_data['losing_score']
+
+        if winning_score is not None and losing_score is not None:
+            winning_score = int(float(winning_score))
+            losing_score = int(float(losing_score))
+
+            if result_data['result'] == 'win':
+                return f"W {winning_score}-{losing_score}"
+            else:
+                return f"L {losing_score}-{winning_score}"
+        else:
+            return "TBA"  # If scores are None, return "TBA"
+    else:
+        # If no result, check if there's a datetime for an unplayed game
+        if event['datetime']:
+            return format_time_to_cst(event['datetime'])
+        else:
+            return "TBD"  # If no datetime is available
+
+# Function to display rankings correctly, preferring one poll and labelling fallbacks
+def format_ranking(ranking, team_name, ranking_index, preferred_poll=DEFAULT_POLL, show_fallbacks=True):
+    if ranking and ranking.isdigit():
+        return f"#{ranking}"
+
+    team_polls = lookup_team(ranking_index, team_name)  # Scraped rankings from the NCAA site
+    if preferred_poll in team_polls:
+        return team_polls[preferred_poll]
+    if show_fallbacks:
+        for poll in POLLS:
+            if poll in team_polls:
+                return f"{team_polls[poll]} ({poll})"
+    return ""  # Leave blank if no ranking available
+
+# Helper function to get the next upcoming game based on today's date
+def get_upcoming_game(schedule_data):
+    today = datetime.now(pytz.timezone('America/Chicago')).date()  # Use date only for comparison
+
+    # Find the next game on or after today's date
+    for event in schedule_data:
+        event_date = datetime.strptime(event['datetime'].split('T')[0], "%Y-%m-%d").date()  # Extract date only
+        if event_date >= today:
+            return event
+
+    # If no future game is found, default to the first game (though this shouldn't happen)
+    return schedule_data[0]
@@ -0,0 +1,96 @@
+import http.client
+import threading
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+# Bytes on the wire for a response's status line and headers, which is all a 304 sends
+def response_header_size(response):
+    size = len(f"HTTP/1.1 {response.status} {response.reason}\r\n")
+    size += sum(len(name) + len(value) + 4 for name, value in response.getheaders())  # "name: value\r\n"
+    return size + 2  # Blank line ending the headers
+
+# One polling client: keeps a connection open and fetches the page until the deadline
+def poll(url, deadline, conditional, encoding, stats, lock):
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=10)
+    etag = None
+    statuses = Counter()
+    requests_made = 0
+    body_bytes = 0
+    header_bytes = 0
+    latencies = []
+
+    try:
+        while time.perf_counter() < deadline:
+            headers = {'Accept-Encoding': encoding} if encoding else {}
+            if conditional and etag:
+                headers['If-None-Match'] = etag  # What a kiosk's browser sends when revalidating
+
+            started = time.perf_counter()
+            try:
+                connection.request("GET", path, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (OSError, http.client.HTTPException):
+                statuses['error'] += 1
+                connection.close()
+                continue
+            latencies.append(time.perf_counter() - started)
+
+            requests_made += 1
+            body_bytes += len(body)
+            header_bytes += response_header_size(response)
+            statuses[response.status] += 1
+            etag = response.getheader('ETag') or etag
+    finally:
+        connection.close()
+
+    with lock:
+        stats['requests'] += requests_made
+        stats['body_bytes'] += body_bytes
+        stats['header_bytes'] += header_bytes
+        stats['statuses'].update(statuses)
+        stats['latencies'].extend(latencies)
+
+# Run many polling clients against url at once and measure throughput
+def run_load_test(url, clients=50, duration=10.0, conditional=True, encoding="br, gzip"):
+    stats = {'requests': 0, 'body_bytes': 0, 'header_bytes': 0, 'statuses': Counter(), 'latencies': []}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    threads = [threading.Thread(target=poll, args=(url, deadline, conditional, encoding, stats, lock))
+               for _ in range(clients)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(stats['latencies'])
+    return {
+        'clients': clients,
+        'seconds': elapsed,
+        'requests': stats['requests'],
+        'requests_per_second': stats['requests'] / elapsed if elapsed else 0.0,
+        'body_bytes': stats['body_bytes'],
+        'header_bytes': stats['header_bytes'],
+        'bytes': stats['body_bytes'] + stats['header_bytes'],
+        'bytes_per_second': (stats['body_bytes'] + stats['header_bytes']) / elapsed if elapsed else 0.0,
+        'statuses': dict(stats['statuses']),
+        'p50_ms': latencies[len(latencies) // 2] * 1000 if latencies else 0.0,
+        'p99_ms': latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0.0,
+    }
+
+def format_report(result):
+    statuses = ", ".join(f"{status}: {count}" for status, count in sorted(result['statuses'].items(), key=str))
+    return (
+        f"{result['clients']} clients for {result['seconds']:.1f}s\n"
+        f"Requests:  {result['requests']} ({result['requests_per_second']:.1f} req/s)\n"
+        f"Bytes:     {result['bytes']} ({result['bytes_per_second'] / 1024:.1f} KiB/s): "
+        f"{result['body_bytes']} body + {result['header_bytes']} status line and headers\n"
+        f"Latency:   p50 {result['p50_ms']:.2f} ms, p99 {result['p99_ms']:.2f} ms\n"
+        f"Statuses:  {statuses}"
+    )
@@ -0,0 +1,84 @@
+import json
+import os
+
+from .formatting import DEFAULT_SEASON, filter_season_schedule, format_date, get_upcoming_game
+from .rankings import DEFAULT_POLL, RANKINGS_CACHE_FILENAME, fetch_ranking_index
+from .render import generate_html
+from .row_cache import ROW_CACHE_FILENAME, load_row_cache, save_row_cache
+from .sources import fetch_schedule, get_nebraska_odds
+
+CACHE_FILENAME = "schedule_cache.json"
+
+# Output of each pipeline run in this process, keyed by its arguments
+_completed_runs = {}
+
+# Fetch everything the page needs from the network
+def fetch_data(season=DEFAULT_SEASON, rankings_cache_path=None):
+    all_data = fetch_schedule()  # Fetch schedule data
+    schedule_data = filter_season_schedule(all_data, season)  # Filter for the requested season
+    if not schedule_data:
+        raise ValueError(f"no games found for the {season} season")
+    ranking_index = fetch_ranking_index(rankings_cache_path)  # Scrape AP, Coaches and CFP polls from the NCAA site
+
+    # Get Nebraska odds and betting information for the next game
+    upcoming_game = get_upcoming_game(schedule_data)
+    upcoming_date = format_date(upcoming_game['datetime'], opponent_name=upcoming_game['opponent_name'])
+    nebraska_spread, bet_description = get_nebraska_odds(upcoming_date)
+
+    return {
+        'season': season,
+        'schedule': schedule_data,
+        'rankings': ranking_index,
+        'odds': [nebraska_spread, bet_description],
+    }
+
+# Save fetched data so later runs can render without the network
+def save_data(data, cache_path):
+    with open(cache_path, "w") as file:
+        json.dump(data, file)
+
+# Load data saved by a previous fetch
+def load_data(cache_path):
+    with open(cache_path) as file:
+        return json.load(file)
+
+# Render fetched data to the output HTML file, reusing unchanged rows from the row cache
+def render_data(data, output_path="index.html", row_cache_path=None, preferred_poll=DEFAULT_POLL):
+    if row_cache_path is None:
+        row_cache_path = os.path.join(os.path.dirname(output_path) or ".", ROW_CACHE_FILENAME)
+
+    row_cache = load_row_cache(row_cache_path, data['season'])
+    cached_keys = set(row_cache)
+    html_content = generate_html(data['schedule'], data['rankings'], odds=tuple(data['odds']),
+                                 output_path=output_path, season=data['season'], row_cache=row_cache,
+                                 preferred_poll=preferred_poll)
+    # Keys are content hashes, so the same keys mean the saved file is already current
+    if set(row_cache) != cached_keys or not os.path.exists(row_cache_path):
+        save_row_cache(row_cache_path, data['season'], row_cache)
+    return html_content
+
+# Run the whole pipeline (fetch, scrape, render) exactly once per process for a given set of arguments
+def run_pipeline(output_path="index.html", season=DEFAULT_SEASON, cache_path=None, offline=False, force=False,
+                 preferred_poll=DEFAULT_POLL):
+    output_path = os.fspath(output_path)
+
+    # Guard against the same run happening twice, e.g. from a second entry point
+    run_key = (output_path, season, cache_path and os.fspath(cache_path), offline, preferred_poll)
+    if run_key in _completed_runs and not force:
+        return _completed_runs[run_key]
+
+    output_dir = os.path.dirname(output_path) or "."
+    if cache_path is None:
+        cache_path = os.path.join(output_dir, CACHE_FILENAME)
+
+    # Offline runs replay the last fetch instead of hitting the network
+    if offline:
+        data = load_data(cache_path)
+        if data['season'] != season:
+            raise ValueError(f"{cache_path} holds the {data['season']} season, not {season}")
+    else:
+        data = fetch_data(season, os.path.join(output_dir, RANKINGS_CACHE_FILENAME))
+        save_data(data, cache_path)
+
+    _completed_runs[run_key] = render_data(data, output_path, preferred_poll=preferred_poll)
+    return _completed_runs[run_key]
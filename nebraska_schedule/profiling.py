@@ -0,0 +1,31 @@
+import cProfile
+import io
+import pstats
+import tracemalloc
+
+# Run func under cProfile and tracemalloc and write a sorted hot-path report
+def profile_call(func, report_path, *args, sort="cumulative", limit=30, **kwargs):
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    try:
+        result = profiler.runcall(func, *args, **kwargs)
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Hot paths by CPU time
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.strip_dirs().sort_stats(sort).print_stats(limit)
+
+    # Hot paths by allocation
+    stream.write(f"\nMemory: current {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB\n")
+    stream.write(f"Top {limit} allocation sites:\n")
+    for stat in snapshot.statistics('lineno')[:limit]:
+        stream.write(f"{stat}\n")
+
+    with open(report_path, "w") as file:
+        file.write(stream.getvalue())
+
+    return result
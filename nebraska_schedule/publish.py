@@ -0,0 +1,87 @@
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional; without it only .gz siblings are written
+    brotli = None
+
+ETAGS_FILENAME = "etags.json"
+
+# Precompressed siblings in order of preference: Content-Encoding -> file suffix
+ENCODINGS = {'br': '.br', 'gzip': '.gz'}
+
+# Compressors for precompressed siblings, keyed by Content-Encoding
+def compressors():
+    found = {'gzip': lambda data: gzip.compress(data, compresslevel=9, mtime=0)}  # mtime=0 keeps output stable
+    if brotli is not None:
+        found['br'] = lambda data: brotli.compress(data, quality=11)
+    return found
+
+# Strong ETag for a file's exact bytes
+def strong_etag(data):
+    return '"' + hashlib.sha256(data).hexdigest()[:32] + '"'
+
+# Write a file so readers only ever see the old or the new bytes, never a partial write
+def write_atomic(path, data):
+    directory = os.path.dirname(path) or "."
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.chmod(temp_path, 0o644)  # mkstemp creates 0600, but the file is meant to be served
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+# The ETag manifest: file name -> {'etag': ..., <encoding>: <sibling etag>, ...}
+def load_etags(directory):
+    try:
+        with open(os.path.join(directory, ETAGS_FILENAME)) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+# Write a generated file with its .gz/.br siblings and record their ETags, skipping work that is already done.
+# Siblings go first, then the file, then the manifest, so the manifest never vouches for missing siblings.
+def publish(path, data=None):
+    path = os.fspath(path)
+    directory = os.path.dirname(path) or "."
+    name = os.path.basename(path)
+    try:
+        with open(path, "rb") as file:
+            on_disk = file.read()
+    except OSError:
+        on_disk = None
+    if data is None:
+        data = on_disk
+
+    etag = strong_etag(data)
+    etags = load_etags(directory)
+    siblings = compressors()
+    entry = etags.get(name)
+    siblings_current = (isinstance(entry, dict) and entry.get('etag') == etag
+                        and all(encoding in entry and os.path.exists(path + ENCODINGS[encoding]) for encoding in siblings))
+    if siblings_current and on_disk == data:
+        return etag
+
+    if not siblings_current:
+        entry = {'etag': etag}
+        for encoding, compress in siblings.items():
+            encoded = compress(data)
+            write_atomic(path + ENCODINGS[encoding], encoded)
+            entry[encoding] = strong_etag(encoded)
+
+    # The page can differ from the manifest even when the siblings don't, e.g. after a git checkout
+    if on_disk != data:
+        write_atomic(path, data)
+
+    if not siblings_current:
+        etags[name] = entry
+        write_atomic(os.path.join(directory, ETAGS_FILENAME), json.dumps(etags, indent=2).encode('utf-8'))
+    return etag
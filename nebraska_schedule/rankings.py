@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time, timedelta
+
+import pytz
+import requests
+from bs4 import BeautifulSoup
+
+RANKINGS_CACHE_FILENAME = "rankings_cache.json"
+
+# Polls in fallback order, with their ncaa.com page, weekly release (weekday, hour in Central time)
+# and the months they are published in (None for all season)
+POLLS = {
+    'AP': ("https://www.ncaa.com/rankings/football/fbs/associated-press", 6, 13, None),
+    'Coaches': ("https://www.ncaa.com/rankings/football/fbs/usa-today-coaches", 6, 13, None),
+    'CFP': ("https://www.ncaa.com/rankings/football/fbs/college-football-playoff", 1, 18, (11, 12)),
+}
+DEFAULT_POLL = 'AP'
+
+CENTRAL = pytz.timezone('America/Chicago')
+
+# Clean a poll's team name for display, e.g. "Southern California (3)" -> "USC"
+def clean_team_name(team_name):
+    team_name = re.sub(r'\s\(\d+\)', '', team_name.strip())  # Drop first-place vote counts
+
+    # Handle special cases for teams like USC
+    if "Southern Cal" in team_name or "Southern California" in team_name:
+        team_name = "USC"
+
+    return team_name
+
+# Normalize a team name so the same school matches across polls and the schedule
+def normalize_team(team_name):
+    return re.sub(r'[^a-z0-9&]+', ' ', clean_team_name(team_name).lower()).strip()
+
+# Pull team -> "#rank" out of an ncaa.com rankings page
+def parse_poll(content):
+    soup = BeautifulSoup(content, 'html.parser')
+    table = soup.find('table')
+    rankings = {}
+
+    if table:
+        rows = table.find_all('tr')
+
+        # Loop through rows, skipping the first (header row)
+        for row in rows[1:26]:  # Only get top 25 teams
+            cells = row.find_all('td')
+            if len(cells) < 2:
+                continue
+            rank = cells[0].text.strip()
+            rankings[clean_team_name(cells[1].text)] = f"#{rank}"
+
+    return rankings
+
+# Fetch a single poll from ncaa.com
+def fetch_poll(poll):
+    url = POLLS[poll][0]
+    response = requests.get(url)
+    return parse_poll(response.content)
+
+# Whether a poll is published at this time of year
+def in_window(poll, now):
+    months = POLLS[poll][3]
+    return months is None or now.astimezone(CENTRAL).month in months
+
+# Most recent weekly release of a poll at or before now
+def last_release(poll, now):
+    _, weekday, hour, _ = POLLS[poll]
+    now = now.astimezone(CENTRAL)
+    # Step back in calendar days before localizing, so a release keeps its offset across a DST change
+    day = now.date() - timedelta(days=(now.weekday() - weekday) % 7)
+    release = CENTRAL.localize(datetime.combine(day, time(hour)))
+    if release > now:
+        release = CENTRAL.localize(datetime.combine(day - timedelta(days=7), time(hour)))
+    return release
+
+def load_rankings_cache(cache_path):
+    if not cache_path or not os.path.exists(cache_path):
+        return {}
+    try:
+        with open(cache_path) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}  # A corrupt cache just means fetching every poll again
+
+def save_rankings_cache(cache_path, cache):
+    with open(cache_path, "w") as file:
+        json.dump(cache, file)
+
+# Fingerprint of a poll's rankings, used to tell a new release from last week's page
+def rankings_hash(rankings):
+    return hashlib.sha256(json.dumps(rankings, sort_keys=True).encode('utf-8')).hexdigest()
+
+# Fetch the polls concurrently, reusing any cached poll already confirmed for its latest release.
+# Polls outside their window (CFP outside November and December) are left out entirely.
+def fetch_polls(polls=tuple(POLLS), cache_path=None, now=None):
+    now = now or datetime.now(pytz.utc)
+    cache = load_rankings_cache(cache_path)
+    polls = [poll for poll in polls if in_window(poll, now)]
+
+    results = {}
+    stale = []
+    for poll in polls:
+        cached = cache.get(poll)
+        if cached and cached.get('release') == last_release(poll, now).isoformat():
+            results[poll] = cached['rankings']
+        else:
+            stale.append(poll)
+
+    if stale:
+        with ThreadPoolExecutor(max_workers=len(stale)) as executor:
+            futures = {poll: executor.submit(fetch_poll, poll) for poll in stale}
+            for poll, future in futures.items():
+                cached = cache.get(poll, {})
+                try:
+                    rankings = future.result()
+                except requests.RequestException as e:
+                    print(f"Could not fetch {poll} poll: {e}")
+                    rankings = {}
+
+                # Fall back to last week's poll rather than caching an empty or failed page
+                if not rankings:
+                    results[poll] = cached.get('rankings', {})
+                    continue
+
+                results[poll] = rankings
+                content_hash = rankings_hash(rankings)
+                entry = {'fetched_at': now.isoformat(), 'rankings': rankings, 'hash': content_hash}
+
+                # Only a changed page proves this week's release is out; until then keep re-fetching
+                if cached.get('hash') and cached['hash'] != content_hash:
+                    entry['release'] = last_release(poll, now).isoformat()
+                elif cached.get('release'):
+                    entry['release'] = cached['release']
+                cache[poll] = entry
+
+        if cache_path:
+            save_rankings_cache(cache_path, cache)
+
+    return results
+
+# Merge polls into one lookup: normalized team -> {poll: "#rank"}
+def build_ranking_index(polls):
+    index = {}
+    for poll, rankings in polls.items():
+        for team_name, rank in rankings.items():
+            index.setdefault(normalize_team(team_name), {})[poll] = rank
+    return index
+
+# Fetch every poll and return the merged ranking index
+def fetch_ranking_index(cache_path=None, now=None):
+    return build_ranking_index(fetch_polls(cache_path=cache_path, now=now))
+
+# All poll rankings for a team, e.g. {'AP': '#3', 'CFP': '#5'}
+def lookup_team(ranking_index, team_name):
+    return ranking_index.get(normalize_team(team_name), {})
@@ -0,0 +1,219 @@
+from .formatting import DEFAULT_SEASON, format_date, format_time_to_cst, format_result, format_ranking, get_upcoming_game
+from .publish import publish
+from .rankings import DEFAULT_POLL, lookup_team
+from .row_cache import event_key
+
+# Build the HTML for a single schedule row
+def render_row(event, ranking_index, preferred_poll=DEFAULT_POLL):
+    # Extracting data
+    opponent = event['opponent_name']  # Using opponent_name field now
+    date = format_date(event['datetime'], opponent_name=opponent)
+    opponent_logo_url = event['opponent']['official_logo']['url'] if 'official_logo' in event['opponent'] else ''
+    location = event['location']
+    ranking = format_ranking(event.get('opponent_ranking', ''), opponent, ranking_index, preferred_poll)  # Correct ranking logic
+    result = format_result(event)
+    result_class = "outcome-w" if result.startswith("W") else "outcome-l" if result.startswith("L") else ""
+
+    # Building HTML row
+    return f'''
+        <tr>
+            <td>{date}</td>
+            <td class="left-align"><img src="{opponent_logo_url}" class="logo" alt="{opponent} logo"> {opponent} {ranking}</td>
+            <td>{location}</td>
+            <td class="{result_class}">{result}</td>
+        </tr>
+        '''
+
+# Generate HTML schedule from filtered data
+def generate_html(schedule_data, ranking_index, odds=(None, None), output_path="index.html", season=DEFAULT_SEASON, row_cache=None,
+                  preferred_poll=DEFAULT_POLL):
+    upcoming_game = get_upcoming_game(schedule_data)  # Get the next game based on today's date
+
+    # Extract upcoming game info
+    upcoming_opponent = upcoming_game['opponent_name']
+    upcoming_opponent_logo_url = upcoming_game['opponent']['official_logo']['url']
+    upcoming_location = upcoming_game['location']
+    upcoming_time = format_time_to_cst(upcoming_game['datetime'])
+    upcoming_date = format_date(upcoming_game['datetime'], opponent_name=upcoming_opponent)
+    upcoming_tv_logo_url = ""
+    
+    if upcoming_game['schedule_event_links']:
+        for link in upcoming_game['schedule_event_links']:
+            if link['icon'] and 'url' in link['icon']:
+                upcoming_tv_logo_url = link['icon']['url']
+                break
+
+    # Nebraska odds and betting information are fetched by the pipeline
+    nebraska_spread, bet_description = odds
+
+    # Generate the HTML content
+    html_content = f'''
+    <html>
+    <head>
+        <title>Nebraska Football Schedule {season}</title>
+        <style>
+            @font-face {{
+                font-family: "Liberator";
+                src: url("Liberator.ttf") format("truetype");
+            }}
+            body {{
+                font-family: "Liberator", Arial, sans-serif;
+                background: url('Memorial Stadium Picture.jpg') no-repeat center center fixed;
+                background-size: cover;
+                padding: 20px;
+                color: white;
+                font-size: 24px;
+                display: flex;
+                justify-content: space-between;
+            }}
+            .left-section {{
+                width: 33%;
+                text-align: middle;
+                padding: 20px;
+            }}
+            .left-section img {{
+                width: 50%;
+                margin-bottom: 15px;
+            }}
+            .upcoming-game {{
+                background-color: rgba(0, 0, 0, 0.8); /* Black background */
+                padding: 20px;
+                border-radius: 10px;
+            }}
+            .upcoming-game h2 {{
+                font-size: 28px;
+                margin-bottom: 10px;
+            }}
+            .upcoming-game h1 {{
+                font-size: 36px; /* Increase the size of the opponent name */
+                margin-bottom: 5px;
+                display: inline-block;
+                vertical-align: middle;
+            }}
+            .upcoming-game img {{
+                width: 100px;
+                vertical-align: middle;
+                margin-right: 10px;
+            }}
+            .game-info {{
+                font-size: 18px;
+                text-align: left;
+            }}
+            .game-info td {{
+                padding: 1px; /* Tighten the padding */
+                border: none; /* Remove grid lines */
+                text-align: left; /* Left justify the text */
+            }}
+            .right-section {{
+                width: 66%;
+                padding: 20px;
+            }}
+            table {{
+                width: 100%;
+                margin-top: 20px;
+                border-collapse: collapse;
+                background-color: rgba(255, 255, 255, 0.9);
+                border: none;
+                text-align: left;
+                color: black;
+                box-shadow: 0 4px 8px rgba(0, 0, 0, 0.1);
+            }}
+            th, td {{
+                padding: 8px;
+                border: 1px solid black; /* Adds grid lines */
+                font-size: 20px;
+                line-height: 1.1;
+            }}
+            th {{
+                background-color: rgba(255, 255, 255, 0.7);
+                font-weight: bold;
+            }}
+            td img {{
+                vertical-align: middle;
+                width: 40px;
+                margin-right: 8px;
+            }}
+            .outcome-w {{
+                color: green;
+                font-weight: bold;
+            }}
+            .outcome-l {{
+                color: red;
+                font-weight: bold;
+            }}
+        </style>
+    </head>
+    <body>
+        <div class="left-section">
+            <img src="Nebraska_Cornhuskers_logo.png" alt="Nebraska Logo">
+            <div class="upcoming-game">
+                <h2>Upcoming Game:</h2>
+                <div class="game-info">
+                    <img src="{upcoming_opponent_logo_url}" alt="{upcoming_opponent} Logo">
+                    <h1>{upcoming_opponent}</h1><br>
+                    <table>
+                    <tr>
+                        <td>Date: {upcoming_date}</td>
+                        <td rowspan="3">{f'<img src="{upcoming_tv_logo_url}" alt="TV Network Logo">' if upcoming_tv_logo_url else ''}</td>
+                    </tr>
+                    <tr>
+                        <td>Time: {upcoming_time}</td>
+                    </tr>
+                    <tr>
+                        <td>Location: {upcoming_location}</td>
+                    </tr>
+                      <tr>
+                        <td colspan="2"style="height: 10px;"></td>
+                    </tr>
+                    <tr>
+                        <td colspan="2">Spread: (NEB) {nebraska_spread if nebraska_spread else 'N/A'}</td>
+                    </tr>
+                    <tr>
+                        <td colspan="2">{bet_description if bet_description else 'N/A'}</td>
+                    </tr>
+                    </table>
+                </div>
+            </div>
+        </div>
+        <div class="right-section">
+            <table>
+                <tr>
+                    <th>Date</th>
+                    <th>Opponent</th>
+                    <th>Location</th>
+                    <th>Result</th>
+                </tr>
+    '''
+
+    # Reuse rows rendered on a previous run when their event is unchanged
+    rows_used = {}
+    for event in schedule_data:
+        if row_cache is None:
+            html_content += render_row(event, ranking_index, preferred_poll)
+            continue
+
+        key = event_key(event, lookup_team(ranking_index, event['opponent_name']), preferred_poll)
+        row_html = row_cache.get(key)
+        if row_html is None:
+            row_html = render_row(event, ranking_index, preferred_poll)
+        rows_used[key] = row_html
+        html_content += row_html
+
+    # Leave only this run's rows in the cache so stale ones don't pile up
+    if row_cache is not None:
+        row_cache.clear()
+        row_cache.update(rows_used)
+
+    # Closing HTML
+    html_content += '''
+    </table>
+    </div>
+    </body>
+    </html>
+    '''
+
+    # Writing to index.html, with precompressed siblings and ETags for the static server
+    publish(output_path, html_content.encode('utf-8'))
+
+    return html_content
+
@@ -0,0 +1,46 @@
+import hashlib
+import json
+import os
+
+ROW_CACHE_FILENAME = "row_cache.json"
+
+# Bump whenever render_row's markup or the formatting helpers it calls change, so old rows are dropped
+ROW_CACHE_VERSION = 1
+
+# Hash the parts of an event (plus its scraped rankings) that a schedule row is built from
+def event_key(event, team_polls, preferred_poll):
+    opponent = event.get('opponent') or {}
+    result = event.get('schedule_event_result') or {}
+    # A repr of plain tuples is much cheaper than json.dumps(sort_keys=True) and just as stable
+    normalized = (
+        event.get('opponent_name'),
+        (opponent.get('official_logo') or {}).get('url', ''),
+        event.get('location'),
+        event.get('datetime'),
+        event.get('tba'),
+        event.get('opponent_ranking', ''),
+        tuple(sorted(result.items())),
+        tuple(sorted(team_polls.items())),
+        preferred_poll,
+    )
+    return hashlib.blake2b(repr(normalized).encode('utf-8'), digest_size=16).hexdigest()
+
+# Load cached rows for a season; rows from another season or renderer version are dropped
+def load_row_cache(cache_path, season):
+    if not cache_path or not os.path.exists(cache_path):
+        return {}
+    try:
+        with open(cache_path) as file:
+            stored = json.load(file)
+    except (OSError, ValueError):
+        return {}  # A corrupt cache just means re-rendering every row
+    if stored.get('season') != season:
+        return {}  # Season rolled over, start fresh
+    if stored.get('version') != ROW_CACHE_VERSION:
+        return {}  # Rows were rendered by different markup
+    return stored.get('rows', {})
+
+# Save the rows used by this render, which also drops rows for events that are gone
+def save_row_cache(cache_path, season, rows):
+    with open(cache_path, "w") as file:
+        json.dump({'season': season, 'version': ROW_CACHE_VERSION, 'rows': rows}, file)
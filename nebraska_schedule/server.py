@@ -0,0 +1,237 @@
+import mimetypes
+import os
+import posixpath
+import re
+import stat
+import threading
+from email.utils import formatdate, parsedate_to_datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+from .publish import ENCODINGS, ETAGS_FILENAME, load_etags, strong_etag
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+# Only the published pages and their static assets are served; caches, manifests, precompressed
+# siblings (served via Content-Encoding instead) and anything else in the directory are not
+STATIC_EXTENSIONS = {'.html', '.css', '.js', '.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.ico',
+                     '.ttf', '.otf', '.woff', '.woff2'}
+
+def stat_key(file_stat):
+    return file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino
+
+# Stat of the manifest, which publish() writes last, so any republished sibling changes it too
+def manifest_signature(path):
+    try:
+        return stat_key(os.stat(os.path.join(os.path.dirname(path), ETAGS_FILENAME)))
+    except OSError:
+        return None
+
+# In-memory copy of a file and its precompressed siblings, reloaded when any of them changes
+class CachedFile:
+    def __init__(self, path, file_stat, signature):
+        self.signature = signature
+        self.last_modified = int(file_stat.st_mtime)
+        self.content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        if self.content_type.startswith('text/'):
+            self.content_type += '; charset=utf-8'
+
+        with open(path, "rb") as file:
+            data = file.read()
+        etag = strong_etag(data)
+        self.variants = {'identity': (data, etag)}
+
+        # Only use siblings the manifest vouches for, for exactly this version of the file
+        entry = load_etags(os.path.dirname(path)).get(os.path.basename(path))
+        if not isinstance(entry, dict) or entry.get('etag') != etag:
+            return
+        for encoding, suffix in ENCODINGS.items():
+            try:
+                with open(path + suffix, "rb") as file:
+                    encoded = file.read()
+            except OSError:
+                continue
+            encoded_etag = strong_etag(encoded)
+            if entry.get(encoding) == encoded_etag:
+                self.variants[encoding] = (encoded, encoded_etag)
+
+class FileCache:
+    def __init__(self, directory):
+        self.directory = os.path.abspath(directory)
+        self.files = {}
+        self.lock = threading.Lock()
+
+    # Map a URL path onto a servable path inside the directory, or None if it may not be served
+    def resolve(self, url_path):
+        url_path = posixpath.normpath(unquote(url_path))
+        parts = [part for part in url_path.split('/') if part and part != '.']
+        if any(part.startswith('.') for part in parts):
+            return None  # Dot-paths: .git, temp files from publish(), parent directories
+        if not parts or '.' not in parts[-1]:
+            parts.append('index.html')  # The root or a directory such as /schedule/
+        if os.path.splitext(parts[-1])[1].lower() not in STATIC_EXTENSIONS:
+            return None
+        return os.path.join(self.directory, *parts)
+
+    def get(self, path):
+        if path is None:
+            return None
+        try:
+            file_stat = os.stat(path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(file_stat.st_mode):
+            return None
+
+        # Reload when the page or the manifest changes; siblings are verified against the manifest on load
+        signature = (stat_key(file_stat), manifest_signature(path))
+        with self.lock:
+            cached = self.files.get(path)
+            if cached is None or cached.signature != signature:
+                cached = CachedFile(path, file_stat, signature)
+                self.files[path] = cached
+        return cached
+
+# Pick the best precompressed variant the client accepts
+def choose_encoding(accept_encoding, variants):
+    accepted = set()
+    for item in accept_encoding.split(','):
+        name, _, params = item.strip().partition(';')
+        if params.strip().replace(' ', '') in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+            continue
+        accepted.add(name.strip().lower())
+
+    for encoding in ENCODINGS:
+        if encoding in variants and (encoding in accepted or '*' in accepted):
+            return encoding
+    return 'identity'
+
+# Parse a single "bytes=" range into (start, end) inclusive; None if unsatisfiable, False if ignored
+def parse_range(header, size):
+    match = RANGE_RE.match(header.strip())
+    if not match or match.group(1) == match.group(2) == '':
+        return False  # Multiple or malformed ranges: serve the whole file
+    first, last = match.groups()
+    if first == '':
+        length = int(last)
+        if length == 0:
+            return None
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        return None
+    return start, end
+
+class StaticHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, so polling clients reuse connections
+    server_version = "NebraskaSchedule"
+    cache_control = "no-cache"  # Always revalidate; ETags make that a cheap 304
+    quiet = True
+
+    def do_GET(self):
+        self.serve(send_body=True)
+
+    def do_HEAD(self):
+        self.serve(send_body=False)
+
+    def serve(self, send_body):
+        cached = self.server.file_cache.get(self.server.file_cache.resolve(urlsplit(self.path).path))
+        if cached is None:
+            self.send_empty(HTTPStatus.NOT_FOUND)
+            return
+
+        range_header = self.headers.get('Range')
+        if_range = self.headers.get('If-Range')
+
+        # Ranges are served from the uncompressed bytes so offsets mean the same thing to every client
+        if range_header and self.command == 'GET':
+            encoding = 'identity'
+        else:
+            encoding = choose_encoding(self.headers.get('Accept-Encoding', ''), cached.variants)
+        data, etag = cached.variants[encoding]
+
+        if self.not_modified(cached, etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_validators(cached, etag)  # No Content-Length: a 304 has no body of its own
+            self.end_headers()
+            return
+
+        status = HTTPStatus.OK
+        body = data
+        content_range = None
+        if range_header and self.command == 'GET' and (if_range is None or if_range == etag):
+            byte_range = parse_range(range_header, len(data))
+            if byte_range is None:
+                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_validators(cached, etag)
+                self.send_header('Content-Range', f'bytes */{len(data)}')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            if byte_range:
+                start, end = byte_range
+                status = HTTPStatus.PARTIAL_CONTENT
+                body = data[start:end + 1]
+                content_range = f'bytes {start}-{end}/{len(data)}'
+
+        self.send_response(status)
+        self.send_validators(cached, etag)
+        self.send_header('Content-Type', cached.content_type)
+        self.send_header('Accept-Ranges', 'bytes')
+        if encoding != 'identity':
+            self.send_header('Content-Encoding', encoding)
+        if content_range:
+            self.send_header('Content-Range', content_range)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def not_modified(self, cached, etag):
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            tags = [tag.strip() for tag in if_none_match.split(',')]
+            return '*' in tags or etag in tags or f'W/{etag}' in tags
+
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                return cached.last_modified <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def send_validators(self, cached, etag):
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', formatdate(cached.last_modified, usegmt=True))
+        self.send_header('Cache-Control', self.cache_control)
+        self.send_header('Vary', 'Accept-Encoding')
+
+    def send_empty(self, status):
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+class StaticServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, directory, address=("127.0.0.1", 8000), handler=StaticHandler):
+        self.file_cache = FileCache(directory)
+        super().__init__(address, handler)
+
+# Serve the generated directory until interrupted
+def serve(directory=".", bind="127.0.0.1", port=8000, quiet=False):
+    handler = type('StaticHandler', (StaticHandler,), {'quiet': quiet})
+    with StaticServer(directory, (bind, port), handler) as httpd:
+        host, port = httpd.server_address[:2]
+        print(f"Serving {os.path.abspath(directory)} on http://{host}:{port}/")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,101 @@
+import requests
+from bs4 import BeautifulSoup
+import re
+
+from .rankings import fetch_poll
+
+SCHEDULE_URL = "https://huskers.com/website-api/schedule-events?filter%5Bschedule.sport_id%5D=5&per_page={per_page}&sort=datetime&include=opponent.officialLogo,opponent.customLogo,opponentLogo,schedule.sport,scheduleEventLinks.icon,scheduleEventResult,secondOpponent.officialLogo,secondOpponent.customLogo,secondOpponentLogo,postEventArticle&neutral_event=false&page={page}"
+SCHEDULE_PER_PAGE = 100
+ODDS_URL = 'https://www.foxsports.com/college-football/nebraska-cornhuskers-team-odds'
+
+# Function to scrape the NCAA AP top 25 from the official site
+def scrape_ncaa_rankings():
+    return fetch_poll('AP')
+
+# Function to fetch football schedule across multiple pages
+def fetch_schedule():
+    all_data = []
+    page = 1
+    while True:
+        url = SCHEDULE_URL.format(per_page=SCHEDULE_PER_PAGE, page=page)
+        response = requests.get(url)
+        payload = response.json()
+        data = payload['data']
+        all_data.extend(data)
+
+        # Follow the API's own pagination rather than trusting per_page was honoured
+        meta = payload.get('meta') or {}
+        links = payload.get('links') or {}
+        if 'last_page' in meta:
+            if page >= meta['last_page']:
+                break
+        elif 'next' in links:
+            if not links['next']:
+                break
+        elif not data:
+            # No pagination info: keep going until an empty page
+            break
+
+        page += 1
+
+    return all_data
+
+# Helper function to get Nebraska odds and betting information
+def get_nebraska_odds(upcoming_game_date):
+    # Send a request to the Fox Sports page
+    response = requests.get(ODDS_URL)
+    soup = BeautifulSoup(response.content, 'html.parser')
+
+    event_container = soup.find('div', class_='event-container desktop-cards')
+    if event_container:
+        odds_containers = event_container.find_all('li', class_='entity-odds-container')
+
+        for odds_container in odds_containers:
+            # Extract the game date from the odds container
+            game_date = odds_container.find('div', class_='odds-component-date')
+            if game_date:
+                game_date_text = game_date.text.strip()  # e.g., "Sat, Oct 5 at 8:00 PM"
+
+                # Extract only "Oct 5" from "Sat, Oct 5 at 8:00 PM"
+                odds_month_day = re.search(r'[A-Za-z]+ \d+', game_date_text).group()  # "Oct 5"
+                odds_month, odds_day = odds_month_day.split()  # Split into "Oct" and "5"
+                odds_day = odds_day.lstrip('0')  # Remove leading zero from day
+                odds_month_day = odds_month.lower() + odds_day  # Recombine, e.g., "oct5"
+                print(f"Odds Month Day (Normalized): {odds_month_day}")  # Debugging print
+
+                # Extract only "Oct 05" from "Oct 05 (Sat)" and normalize it for comparison
+                upcoming_month_day = re.search(r'[A-Za-z]+ \d+', upcoming_game_date).group()  # "Oct 05"
+                upcoming_month, upcoming_day = upcoming_month_day.split()  # Split into "Oct" and "05"
+                upcoming_day = upcoming_day.lstrip('0')  # Remove leading zero from day
+                upcoming_month_day = upcoming_month.lower() + upcoming_day  # Recombine, e.g., "oct5"
+                print(f"Upcoming Month Day (Normalized): {upcoming_month_day}")  # Debugging print
+
+                # Compare the normalized month-day strings
+                if odds_month_day == upcoming_month_day:
+                    # Extract and return spread and bet description if dates match
+                    team_names = odds_container.find_all('div', class_='uc fs-30')
+                    spreads = odds_container.find_all('span', class_='ff-ff fs-20 cl-blk')
+
+                    nebraska_spread = ""
+                    bet_description = ""
+
+                    if len(team_names) == 2 and len(spreads) == 2:
+                        team1_name = team_names[0].text.strip()
+                        team2_name = team_names[1].text.strip()
+                        team1_spread = spreads[0].text.strip()
+                        team2_spread = spreads[1].text.strip()
+
+                        # Determine if 'NEB' is team1 or team2
+                        if 'NEB' in team1_name:
+                            nebraska_spread = team1_spread
+                        else:
+                            nebraska_spread = team2_spread
+
+                    # Extract bet description
+                    bet_description_container = odds_container.find('div', class_='bet-description')
+                    if bet_description_container:
+                        bet_description = bet_description_container.text.strip()
+
+                    return nebraska_spread, bet_description
+
+    return None, None
@@ -0,0 +1,46 @@
+from collections import Counter
+from urllib.parse import urlparse
+
+import pytest
+
+from nebraska_schedule import sources
+
+EVENT = {
+    'opponent_name': "Iowa",
+    'opponent': {'official_logo': {'url': "iowa.png"}},
+    'location': "Lincoln, Neb.",
+    'datetime': "2099-11-29T17:30:00.000Z",
+    'schedule': {'name': "Football 2024"},
+    'schedule_event_links': [],
+    'schedule_event_result': {'result': None},
+}
+
+NCAA_HTML = b"<table><tr><th>Rank</th><th>School</th></tr><tr><td>1</td><td>Iowa (12)</td></tr></table>"
+FOX_HTML = b"<div class='event-container desktop-cards'></div>"
+
+
+class FakeResponse:
+    def __init__(self, content=b"", json_data=None):
+        self.content = content
+        self._json_data = json_data
+
+    def json(self):
+        return self._json_data
+
+
+@pytest.fixture
+def fake_get(monkeypatch):
+    calls = Counter()
+
+    def get(url, *args, **kwargs):
+        parsed = urlparse(url)
+        host = parsed.netloc
+        calls[host + parsed.path] += 1
+        if host == "huskers.com":
+            return FakeResponse(json_data={'data': [EVENT], 'meta': {'current_page': 1, 'last_page': 1}})
+        if host == "www.ncaa.com":
+            return FakeResponse(NCAA_HTML)
+        return FakeResponse(FOX_HTML)
+
+    monkeypatch.setattr(sources.requests, "get", get)
+    return calls
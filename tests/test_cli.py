@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from nebraska_schedule import cli, pipeline, sources
+
+from conftest import EVENT
+
+
+def write_cache(path):
+    data = {'season': 2024, 'schedule': [EVENT], 'rankings': {"iowa": {'AP': "#1"}}, 'odds': ["-3.5", "NEB -3.5"]}
+    path.write_text(json.dumps(data))
+
+
+def test_render_uses_cache_without_network(monkeypatch, tmp_path):
+    def no_network(*args, **kwargs):
+        raise AssertionError("render must not hit the network")
+
+    monkeypatch.setattr(sources.requests, "get", no_network)
+    write_cache(tmp_path / pipeline.CACHE_FILENAME)
+
+    assert cli.main(["render", "--output-dir", str(tmp_path)]) == 0
+    html = (tmp_path / "index.html").read_text()
+    assert "Iowa #1" in html
+    assert "NEB -3.5" in html
+
+
+def test_fetch_then_render(fake_get, tmp_path):
+    cli.main(["fetch", "--output-dir", str(tmp_path)])
+    cli.main(["render", "--output-dir", str(tmp_path)])
+
+    assert set(fake_get.values()) == {1}  # render made no requests of its own
+    assert json.loads((tmp_path / pipeline.CACHE_FILENAME).read_text())['season'] == 2024
+    assert "Iowa" in (tmp_path / "index.html").read_text()
+
+
+def test_profile_writes_report(fake_get, tmp_path):
+    report = tmp_path / "profile.txt"
+    cli.main(["--output-dir", str(tmp_path), "--profile", str(report)])
+
+    text = report.read_text()
+    assert "cumulative" in text
+    assert "peak" in text
+
+
+def test_options_only_where_they_apply(tmp_path):
+    with pytest.raises(SystemExit):
+        cli.main(["fetch", "--offline", "--output-dir", str(tmp_path)])
+    with pytest.raises(SystemExit):
+        cli.main(["render", "--season", "2025", "--output-dir", str(tmp_path)])
+
+
+def test_run_is_the_default_even_when_an_option_value_is_a_command(fake_get, tmp_path):
+    output_dir = tmp_path / "run"
+    assert cli.main(["--output-dir", str(output_dir)]) == 0
+    assert (output_dir / "index.html").exists()
+
+
+def test_offline_run_rejects_other_season(tmp_path):
+    write_cache(tmp_path / pipeline.CACHE_FILENAME)
+
+    with pytest.raises(ValueError):
+        cli.main(["run", "--offline", "--season", "2025", "--output-dir", str(tmp_path)])
+
+
+def test_season_without_games_is_an_error(fake_get, tmp_path):
+    with pytest.raises(ValueError, match="no games found for the 2025 season"):
+        cli.main(["run", "--season", "2025", "--output-dir", str(tmp_path)])
@@ -0,0 +1,54 @@
+from datetime import datetime
+
+import pytz
+from conftest import FakeResponse
+
+from nebraska_schedule import pipeline, rankings, sources
+
+
+def test_each_source_requested_once_per_run(fake_get, tmp_path):
+    html = pipeline.run_pipeline(output_path=tmp_path / "index.html")
+
+    expected = {
+        "huskers.com/website-api/schedule-events",
+        "www.ncaa.com/rankings/football/fbs/associated-press",
+        "www.ncaa.com/rankings/football/fbs/usa-today-coaches",
+        "www.foxsports.com/college-football/nebraska-cornhuskers-team-odds",
+    }
+    if rankings.in_window('CFP', datetime.now(pytz.utc)):
+        expected.add("www.ncaa.com/rankings/football/fbs/college-football-playoff")
+
+    assert set(fake_get.values()) == {1}
+    assert set(fake_get) == expected
+    assert "Iowa" in html
+    assert (tmp_path / "index.html").read_text() == html
+
+
+def test_second_run_is_guarded(fake_get, tmp_path):
+    first = pipeline.run_pipeline(output_path=tmp_path / "index.html")
+    second = pipeline.run_pipeline(output_path=tmp_path / "index.html")
+
+    assert first == second
+    assert fake_get["huskers.com/website-api/schedule-events"] == 1
+
+
+def test_run_with_other_arguments_is_not_guarded(fake_get, tmp_path):
+    pipeline.run_pipeline(output_path=tmp_path / "index.html")
+    pipeline.run_pipeline(output_path=tmp_path / "other.html")
+
+    assert (tmp_path / "other.html").exists()
+    assert fake_get["huskers.com/website-api/schedule-events"] == 2
+
+
+def test_schedule_follows_api_pagination(monkeypatch):
+    pages = []
+
+    # The API returns fewer events per page than asked for
+    def get(url, *args, **kwargs):
+        pages.append(url)
+        return FakeResponse(json_data={'data': [{'page': len(pages)}], 'meta': {'last_page': 3}})
+
+    monkeypatch.setattr(sources.requests, "get", get)
+
+    assert sources.fetch_schedule() == [{'page': 1}, {'page': 2}, {'page': 3}]
+    assert len(pages) == 3
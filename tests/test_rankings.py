@@ -0,0 +1,96 @@
+from datetime import datetime
+
+import pytz
+
+from nebraska_schedule import rankings
+from nebraska_schedule.formatting import format_ranking
+
+
+def test_index_merges_polls_by_normalized_team():
+    index = rankings.build_ranking_index({
+        'AP': {"Southern California": "#9", "Texas A&M": "#12"},
+        'CFP': {"USC": "#11"},
+    })
+
+    assert rankings.lookup_team(index, "USC") == {'AP': "#9", 'CFP': "#11"}
+    assert rankings.lookup_team(index, "texas a&m") == {'AP': "#12"}
+
+
+def test_format_ranking_prefers_poll_and_labels_fallbacks():
+    index = rankings.build_ranking_index({'AP': {"Ohio State": "#2"}, 'CFP': {"Ohio State": "#3", "Iowa": "#20"}})
+
+    assert format_ranking("", "Ohio State", index, preferred_poll='CFP') == "#3"
+    assert format_ranking("", "Iowa", index) == "#20 (CFP)"
+    assert format_ranking("", "Iowa", index, show_fallbacks=False) == ""
+    assert format_ranking("7", "Iowa", index) == "#7"
+
+
+def fake_polls(monkeypatch, pages):
+    fetched = []
+
+    def fetch_poll(poll):
+        fetched.append(poll)
+        return dict(pages[poll])
+
+    monkeypatch.setattr(rankings, "fetch_poll", fetch_poll)
+    return fetched
+
+
+def test_polls_refetched_after_release_until_page_changes(monkeypatch, tmp_path):
+    pages = {poll: {"Iowa": "#20"} for poll in rankings.POLLS}
+    fetched = fake_polls(monkeypatch, pages)
+    cache_path = tmp_path / rankings.RANKINGS_CACHE_FILENAME
+    central = pytz.timezone('America/Chicago')
+
+    # Nothing to compare the first fetch with, so it isn't trusted as this week's release yet
+    rankings.fetch_polls(cache_path=cache_path, now=central.localize(datetime(2024, 11, 4, 9)))
+    pages.update({poll: {"Iowa": "#19"} for poll in rankings.POLLS})
+    rankings.fetch_polls(cache_path=cache_path, now=central.localize(datetime(2024, 11, 4, 10)))
+    rankings.fetch_polls(cache_path=cache_path, now=central.localize(datetime(2024, 11, 4, 11)))
+    assert len(fetched) == 6
+
+    # CFP is due Tuesday evening, but ncaa.com still shows last week's page at first
+    fetched.clear()
+    rankings.fetch_polls(cache_path=cache_path, now=central.localize(datetime(2024, 11, 5, 19)))
+    pages['CFP'] = {"Iowa": "#18"}
+    polls = rankings.fetch_polls(cache_path=cache_path, now=central.localize(datetime(2024, 11, 5, 20)))
+    rankings.fetch_polls(cache_path=cache_path, now=central.localize(datetime(2024, 11, 5, 21)))
+    assert fetched == ['CFP', 'CFP']
+    assert polls['CFP'] == {"Iowa": "#18"}
+
+
+def test_empty_poll_is_not_cached(monkeypatch, tmp_path):
+    pages = {'AP': {"Iowa": "#20"}, 'Coaches': {}, 'CFP': {}}
+    fetched = fake_polls(monkeypatch, pages)
+    cache_path = tmp_path / rankings.RANKINGS_CACHE_FILENAME
+    now = pytz.timezone('America/Chicago').localize(datetime(2024, 11, 4, 9))
+
+    polls = rankings.fetch_polls(cache_path=cache_path, now=now)
+    assert polls['Coaches'] == {}
+    assert 'Coaches' not in rankings.load_rankings_cache(cache_path)
+
+    fetched.clear()
+    rankings.fetch_polls(cache_path=cache_path, now=now)
+    assert 'Coaches' in fetched
+
+
+def test_cfp_only_fetched_in_its_window(monkeypatch):
+    pages = {poll: {"Iowa": "#20"} for poll in rankings.POLLS}
+    fetched = fake_polls(monkeypatch, pages)
+
+    polls = rankings.fetch_polls(now=pytz.timezone('America/Chicago').localize(datetime(2024, 10, 6, 14)))
+
+    assert 'CFP' not in polls
+    assert sorted(fetched) == ['AP', 'Coaches']
+
+
+def test_release_is_stable_across_dst_change():
+    central = pytz.timezone('America/Chicago')
+
+    # DST ended 2024-11-03 at 2am; both times fall in the week of the Oct 27 release
+    before = rankings.last_release('AP', central.localize(datetime(2024, 11, 2, 12)))
+    after = rankings.last_release('AP', central.localize(datetime(2024, 11, 3, 10)))
+
+    assert before.isoformat() == after.isoformat() == "2024-10-27T13:00:00-05:00"
+    assert rankings.last_release('CFP', central.localize(datetime(2024, 11, 4, 9))).isoformat() == \
+        "2024-10-29T18:00:00-05:00"
@@ -0,0 +1,60 @@
+import copy
+
+from nebraska_schedule import pipeline, render, row_cache
+from nebraska_schedule.row_cache import ROW_CACHE_FILENAME, load_row_cache
+
+from conftest import EVENT
+
+
+def make_data(season=2024, result=None):
+    event = copy.deepcopy(EVENT)
+    event['schedule_event_result'] = {'result': result, 'winning_score': "28", 'losing_score': "10"}
+    return {'season': season, 'schedule': [event], 'rankings': {}, 'odds': [None, None]}
+
+
+def count_renders(monkeypatch):
+    calls = []
+    original = render.render_row
+
+    def counting(event, *args):
+        calls.append(event['opponent_name'])
+        return original(event, *args)
+
+    monkeypatch.setattr(render, "render_row", counting)
+    return calls
+
+
+def test_unchanged_rows_are_reused(monkeypatch, tmp_path):
+    calls = count_renders(monkeypatch)
+    output = tmp_path / "index.html"
+
+    first = pipeline.render_data(make_data(), output)
+    second = pipeline.render_data(make_data(), output)
+
+    assert first == second
+    assert calls == ["Iowa"]
+
+
+def test_changed_row_is_rerendered(monkeypatch, tmp_path):
+    calls = count_renders(monkeypatch)
+    output = tmp_path / "index.html"
+
+    pipeline.render_data(make_data(), output)
+    html = pipeline.render_data(make_data(result="win"), output)
+
+    assert calls == ["Iowa", "Iowa"]
+    assert "W 28-10" in html
+    assert len(load_row_cache(tmp_path / ROW_CACHE_FILENAME, 2024)) == 1
+
+
+def test_season_rollover_evicts_rows(tmp_path):
+    pipeline.render_data(make_data(), tmp_path / "index.html")
+
+    assert load_row_cache(tmp_path / ROW_CACHE_FILENAME, 2025) == {}
+
+
+def test_renderer_version_change_evicts_rows(monkeypatch, tmp_path):
+    pipeline.render_data(make_data(), tmp_path / "index.html")
+    monkeypatch.setattr(row_cache, "ROW_CACHE_VERSION", row_cache.ROW_CACHE_VERSION + 1)
+
+    assert load_row_cache(tmp_path / ROW_CACHE_FILENAME, 2024) == {}
@@ -0,0 +1,123 @@
+import gzip
+import http.client
+import json
+import threading
+
+import pytest
+
+from nebraska_schedule.loadtest import run_load_test
+from nebraska_schedule.publish import ETAGS_FILENAME, publish, strong_etag, write_atomic
+from nebraska_schedule.server import StaticServer
+
+PAGE = b"<html><body>" + b"Go Big Red! " * 200 + b"</body></html>"
+
+
+@pytest.fixture
+def server(tmp_path):
+    (tmp_path / "index.html").write_bytes(PAGE)
+    publish(tmp_path / "index.html")
+
+    httpd = StaticServer(str(tmp_path), ("127.0.0.1", 0))
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def get(server, path="/", **headers):
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+    connection.request("GET", path, headers=headers)
+    response = connection.getresponse()
+    body = response.read()
+    connection.close()
+    return response, body
+
+
+def test_publish_writes_gzip_sibling_and_etag(tmp_path):
+    (tmp_path / "index.html").write_bytes(PAGE)
+    etag = publish(tmp_path / "index.html")
+
+    encoded = (tmp_path / "index.html.gz").read_bytes()
+    assert gzip.decompress(encoded) == PAGE
+    manifest = json.loads((tmp_path / ETAGS_FILENAME).read_text())
+    assert manifest["index.html"]['etag'] == etag
+    assert manifest["index.html"]['gzip'] == strong_etag(encoded)
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_publish_rewrites_page_changed_behind_its_back(tmp_path):
+    publish(tmp_path / "index.html", PAGE)
+    (tmp_path / "index.html").write_bytes(b"<html>something else</html>")
+
+    publish(tmp_path / "index.html", PAGE)
+    assert (tmp_path / "index.html").read_bytes() == PAGE
+
+
+def test_serves_precompressed_and_revalidates(server):
+    response, body = get(server, **{'Accept-Encoding': "gzip"})
+    assert response.status == 200
+    assert response.getheader('Content-Encoding') == "gzip"
+    assert gzip.decompress(body) == PAGE
+
+    response, body = get(server, **{'Accept-Encoding': "gzip", 'If-None-Match': response.getheader('ETag')})
+    assert response.status == 304
+    assert body == b""
+    assert response.getheader('Content-Length') is None
+
+
+def test_sibling_rewritten_under_running_server(server, tmp_path):
+    get(server, **{'Accept-Encoding': "gzip"})  # Warm the server's cache
+
+    # A sibling rewritten in place outside publish() doesn't disturb the verified copy in memory
+    (tmp_path / "index.html.gz").write_bytes(b"")
+    response, body = get(server, **{'Accept-Encoding': "gzip"})
+    assert gzip.decompress(body) == PAGE
+
+    # Once the manifest changes the server reloads, and a sibling that fails its hash isn't served
+    write_atomic(str(tmp_path / ETAGS_FILENAME), (tmp_path / ETAGS_FILENAME).read_bytes())
+    response, body = get(server, **{'Accept-Encoding': "gzip"})
+    assert response.getheader('Content-Encoding') is None
+    assert body == PAGE
+
+    # Publishing a new page swaps in matching siblings, picked up on the next request
+    publish(tmp_path / "index.html", PAGE + b"<!-- updated -->")
+    response, body = get(server, **{'Accept-Encoding': "gzip"})
+    assert response.getheader('Content-Encoding') == "gzip"
+    assert gzip.decompress(body) == PAGE + b"<!-- updated -->"
+
+
+@pytest.mark.parametrize("path", [
+    "/.git/config",
+    "/schedule_cache.json",
+    "/etags.json",
+    "/index.html.gz",
+    "/.index.html.abc.tmp",
+    "/../index.html.gz",
+])
+def test_only_pages_and_assets_are_served(server, tmp_path, path):
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "config").write_text("[core]")
+    (tmp_path / "schedule_cache.json").write_text("{}")
+    (tmp_path / ".index.html.abc.tmp").write_text("partial")
+
+    response, _ = get(server, path)
+    assert response.status == 404
+
+
+def test_range_requests(server):
+    response, body = get(server, Range="bytes=0-5")
+    assert response.status == 206
+    assert body == PAGE[:6]
+    assert response.getheader('Content-Range') == f"bytes 0-5/{len(PAGE)}"
+
+    response, _ = get(server, Range=f"bytes={len(PAGE)}-")
+    assert response.status == 416
+
+
+def test_load_test_reports_throughput(server):
+    result = run_load_test(f"http://127.0.0.1:{server.server_address[1]}/", clients=4, duration=0.3)
+
+    assert result['requests'] > 0
+    assert result['header_bytes'] > 0
+    assert result['bytes'] == result['body_bytes'] + result['header_bytes']
+    assert set(result['statuses']) <= {200, 304}